@@ -1,9 +1,19 @@
+import msgspec
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Set, List, Optional, Type, Any
 
 from nexustrader.schema import Order, Position, AlgoOrder, Balance, AccountBalance
 from nexustrader.constants import AccountType, ExchangeType
 
+_encoder = msgspec.json.Encoder()
+_param_decoder = msgspec.json.Decoder()
+
+
+@lru_cache(maxsize=None)
+def _decoder(obj_type: type) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(obj_type)
+
 
 class StorageBackend(ABC):
     def __init__(
@@ -109,23 +119,15 @@ class StorageBackend(ABC):
         self._storage_initialized = True
 
     def _encode(self, obj: Order | Position | AlgoOrder | Balance) -> bytes:
-        import msgspec
-
-        return msgspec.json.encode(obj)
+        return _encoder.encode(obj)
 
     def _decode(
         self, data: bytes, obj_type: Type[Order | Position | AlgoOrder | Balance]
     ) -> Order | Position | AlgoOrder | Balance:
-        import msgspec
-
-        return msgspec.json.decode(data, type=obj_type)
+        return _decoder(obj_type).decode(data)
 
     def _encode_param(self, obj: Any) -> bytes:
-        import msgspec
-
-        return msgspec.json.encode(obj)
+        return _encoder.encode(obj)
 
     def _decode_param(self, data: bytes) -> Any:
-        import msgspec
-
-        return msgspec.json.decode(data)
+        return _param_decoder.decode(data)
@@ -1,10 +1,30 @@
+import re
 from abc import ABC
-from typing import Optional
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
 from curl_cffi import requests
 from nexustrader.core.nautilius_core import LiveClock, Logger
 from nexustrader.constants import RateLimiter
 from nexustrader.base.retry import RetryManager
 
+_QUERY_SAFE_VALUE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+def encode_query(params: Dict[str, Any]) -> str:
+    """``urlencode(params)`` that skips quoting when every value is URL-safe.
+
+    Keys are API parameter names. Values such as symbols, ids and numbers
+    rarely need escaping, so the common case is a plain join; any other value
+    falls back to ``urlencode``.
+    """
+    parts = []
+    for key, value in params.items():
+        value = str(value)
+        if _QUERY_SAFE_VALUE.fullmatch(value) is None:
+            return urlencode(params)
+        parts.append(f"{key}={value}")
+    return "&".join(parts)
+
 
 class ApiClient(ABC):
     def __init__(
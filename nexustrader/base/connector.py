@@ -3,10 +3,10 @@ from typing import Dict, List, Literal
 from decimal import Decimal
 import asyncio
 
-from decimal import ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
 from nexustrader.base.oms import OrderManagementSystem
 from nexustrader.base.ws_client import WSClient
 from nexustrader.base.api_client import ApiClient
+from nexustrader.base.precision import to_precision
 from nexustrader.base.exchange import ExchangeManager
 from nexustrader.aggregation import (
     KlineAggregator,
@@ -425,30 +425,7 @@ class PrivateConnector(ABC):
         Convert the price to the precision of the market
         """
         market = self._market[symbol]
-        price: Decimal = Decimal(str(price))
-
-        decimal = market.precision.price
-
-        if decimal >= 1:
-            exp = Decimal(int(decimal))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(decimal))
-
-        if mode == "round":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_price
+        return to_precision(price, market.precision.price, mode)
 
     @abstractmethod
     async def connect(self):
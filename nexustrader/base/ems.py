@@ -3,7 +3,6 @@ from abc import ABC, abstractmethod
 from typing import Dict, List
 from typing import Literal
 from decimal import Decimal
-from decimal import ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
 
 from nexustrader.schema import BaseMarket
 from nexustrader.core.entity import TaskManager
@@ -38,6 +37,7 @@ from nexustrader.schema import (
     BatchOrderSubmit,
 )
 from nexustrader.base.connector import PrivateConnector
+from nexustrader.base.precision import to_precision
 
 
 class ExecutionManagementSystem(ABC):
@@ -80,29 +80,7 @@ class ExecutionManagementSystem(ABC):
         Convert the amount to the precision of the market
         """
         market = self._market[symbol]
-        amount: Decimal = Decimal(str(amount))
-        precision = market.precision.amount
-
-        if precision >= 1:
-            exp = Decimal(int(precision))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(precision))
-
-        if mode == "round":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_amount
+        return to_precision(amount, market.precision.amount, mode)
 
     def _price_to_precision(
         self,
@@ -114,30 +92,7 @@ class ExecutionManagementSystem(ABC):
         Convert the price to the precision of the market
         """
         market = self._market[symbol]
-        price: Decimal = Decimal(str(price))
-
-        decimal = market.precision.price
-
-        if decimal >= 1:
-            exp = Decimal(int(decimal))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(decimal))
-
-        if mode == "round":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_price
+        return to_precision(price, market.precision.price, mode)
 
     @abstractmethod
     def _instrument_id_to_account_type(
@@ -2,7 +2,6 @@ import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Literal
 from decimal import Decimal
-from decimal import ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
 from nexustrader.constants import AccountType, ExchangeType, WsOrderResultType
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.nautilius_core import Logger, LiveClock, MessageBus
@@ -10,6 +9,7 @@ from nexustrader.core.entity import TaskManager
 from nexustrader.core.registry import OrderRegistry
 from nexustrader.base.api_client import ApiClient
 from nexustrader.base.ws_client import WSClient
+from nexustrader.base.precision import to_precision
 from nexustrader.schema import (
     Order,
     BaseMarket,
@@ -70,6 +70,14 @@ class OrderManagementSystem(ABC):
     def _run_sync(self, coro):
         return self._task_manager.run_sync(coro)
 
+    def _run_sync_all(self, *coros) -> list:
+        """Run independent startup requests concurrently; results keep argument order."""
+
+        async def _gather():
+            return await asyncio.gather(*coros)
+
+        return self._run_sync(_gather())
+
     def _publish_private_ws_event(self, event: str):
         self._msgbus.publish(
             topic="private_ws_status",
@@ -426,30 +434,7 @@ class OrderManagementSystem(ABC):
         Convert the price to the precision of the market
         """
         market = self._market[symbol]
-        price: Decimal = Decimal(str(price))
-
-        decimal = market.precision.price
-
-        if decimal >= 1:
-            exp = Decimal(int(decimal))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(decimal))
-
-        if mode == "round":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_price
+        return to_precision(price, market.precision.price, mode)
 
     @abstractmethod
     def _init_account_balance(self):
@@ -0,0 +1,37 @@
+from decimal import Decimal
+from decimal import ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
+from functools import lru_cache
+from typing import Literal, Tuple
+
+ROUNDING_MODES = {
+    "round": ROUND_HALF_UP,
+    "ceil": ROUND_CEILING,
+    "floor": ROUND_FLOOR,
+}
+
+
+@lru_cache(maxsize=None)
+def precision_quantizer(precision: float) -> Tuple[Decimal, Decimal]:
+    """
+    Return the ``(exp, quantum)`` pair used to round values to ``precision``.
+
+    Market precisions are a small fixed set, so the Decimals are built once per
+    distinct precision instead of on every order.
+    """
+    if precision >= 1:
+        return Decimal(int(precision)), Decimal("1")
+    return Decimal("1"), Decimal(str(precision))
+
+
+def to_precision(
+    value: float,
+    precision: float,
+    mode: Literal["round", "ceil", "floor"] = "round",
+) -> Decimal:
+    """
+    Round ``value`` to ``precision`` using the cached quantizer
+    """
+    exp, quantum = precision_quantizer(precision)
+    return (Decimal(str(value)) / exp).quantize(
+        quantum, rounding=ROUNDING_MODES[mode]
+    ) * exp
@@ -2,7 +2,7 @@ import asyncio
 import msgspec
 from abc import ABC, abstractmethod
 from types import MethodType
-from typing import Any
+from typing import Any, Hashable
 from typing import Callable, Literal
 
 
@@ -30,6 +30,18 @@ from nexustrader.core.nautilius_core import LiveClock, Logger
 # picows_logger.setLevel(PICOWS_DEBUG_LL)
 # picows_logger.addHandler(file_handler)
 
+# picows writes the frame header in front of the payload when sending from a
+# reusable bytearray; it needs at most 14 bytes for that.
+_WS_FRAME_HEADER_RESERVE = 14
+
+
+def _subscription_key(param: Any) -> Hashable:
+    # dict params (OKX, Bitget, Hyperliquid) compare by their items, as they did
+    # when subscriptions were tracked in a list
+    if isinstance(param, dict):
+        return frozenset(param.items())
+    return param
+
 
 class Listener(WSListener):
     """WebSocket listener implementation that handles connection events and message frames.
@@ -166,8 +178,13 @@ class WSClient(ABC):
         self._user_pong_callback = user_pong_callback
         self._listener: Listener = None
         self._transport = None
-        self._subscriptions = []
+        # insertion-ordered so _resubscribe replays subscriptions in order
+        self._subscriptions: dict[Hashable, Any] = {}
         self._callback = handler
+        self._encoder = msgspec.json.Encoder()
+        self._send_buffer = bytearray()
+        self._connect_lock = asyncio.Lock()
+        self._connection_handler_task: asyncio.Task | None = None
         if auto_ping_strategy == "ping_when_idle":
             self._auto_ping_strategy = WSAutoPingStrategy.PING_WHEN_IDLE
         elif auto_ping_strategy == "ping_periodically":
@@ -223,17 +240,35 @@ class WSClient(ABC):
             raise e
 
     async def connect(self):
-        if not self.connected:
-            await self._connect()
-            self._task_manager.create_task(self._connection_handler())
+        if self.connected:
+            return
+        # concurrent subscribe_* calls and the reconnect loop must share one
+        # connection rather than each opening their own while a handshake is
+        # in flight
+        async with self._connect_lock:
+            if self.connected:
+                return
+            if self._connection_handler_task is None:
+                await self._connect()
+                self._connection_handler_task = self._task_manager.create_task(
+                    self._connection_handler()
+                )
+            else:
+                await self._reconnect()
+
+    async def _reconnect(self):
+        # caller holds _connect_lock
+        await self._connect()
+        await self._resubscribe()
+        self._emit_hook(self._on_reconnected)
 
     async def _connection_handler(self):
         while True:
             try:
                 if not self.connected:
-                    await self._connect()
-                    await self._resubscribe()
-                    self._emit_hook(self._on_reconnected)
+                    async with self._connect_lock:
+                        if not self.connected:
+                            await self._reconnect()
                 await self._transport.wait_disconnected()
             except Exception as e:
                 self._log.error(f"Connection error: {e}")
@@ -243,11 +278,35 @@ class WSClient(ABC):
                 await self.disconnect()
             await asyncio.sleep(self._reconnect_interval)
 
+    def _add_subscriptions(self, params: list) -> list:
+        """Track *params* and return those that were not already subscribed."""
+        subscriptions = self._subscriptions
+        added = []
+        for param in params:
+            key = _subscription_key(param)
+            if key not in subscriptions:
+                subscriptions[key] = param
+                added.append(param)
+        return added
+
+    def _remove_subscriptions(self, params: list) -> list:
+        """Stop tracking *params* and return those that were subscribed."""
+        subscriptions = self._subscriptions
+        return [
+            param
+            for param in params
+            if subscriptions.pop(_subscription_key(param), None) is not None
+        ]
+
     def _send(self, payload: dict):
         if not self.connected:
             self._log.warning(f"Websocket not connected. drop msg: {str(payload)}")
             return False
-        self._transport.send(WSMsgType.TEXT, msgspec.json.encode(payload))
+        buffer = self._send_buffer
+        self._encoder.encode_into(payload, buffer, _WS_FRAME_HEADER_RESERVE)
+        self._transport.send_reuse_external_bytearray(
+            WSMsgType.TEXT, buffer, _WS_FRAME_HEADER_RESERVE
+        )
         return True
 
     def _send_or_raise(self, payload: dict):
@@ -18,6 +18,7 @@ from nexustrader.core.nexus_core import (  # noqa: F401
     TraderId,
     UUID4,
     hmac_signature,
+    hmac_signature_base64,
     rsa_signature,
     ed25519_signature,
 )
@@ -105,29 +106,35 @@ class Logger:
         self._log = Logger(name=type(self).__name__)
         # or positionally:
         self._log = Logger(type(self).__name__)
+
+    Extra positional arguments are substituted into ``{}`` placeholders in
+    *msg* by loguru, and only once the record passes the level check, so hot
+    paths can defer formatting large objects::
+
+        self._log.debug("Order update: {}", msg)
     """
 
     def __init__(self, name: str = "") -> None:
         # bind the component name so it appears in every log record
         self._logger = _loguru.bind(component=name)
 
-    def trace(self, msg: str, **kwargs) -> None:
-        self._logger.trace(msg)
+    def trace(self, msg: str, *args, **kwargs) -> None:
+        self._logger.trace(msg, *args)
 
-    def debug(self, msg: str, **kwargs) -> None:
-        self._logger.debug(msg)
+    def debug(self, msg: str, *args, **kwargs) -> None:
+        self._logger.debug(msg, *args)
 
-    def info(self, msg: str, **kwargs) -> None:
-        self._logger.info(msg)
+    def info(self, msg: str, *args, **kwargs) -> None:
+        self._logger.info(msg, *args)
 
-    def warning(self, msg: str, **kwargs) -> None:
-        self._logger.warning(msg)
+    def warning(self, msg: str, *args, **kwargs) -> None:
+        self._logger.warning(msg, *args)
 
-    def error(self, msg: str, **kwargs) -> None:
-        self._logger.error(msg)
+    def error(self, msg: str, *args, **kwargs) -> None:
+        self._logger.error(msg, *args)
 
-    def critical(self, msg: str, **kwargs) -> None:
-        self._logger.critical(msg)
+    def critical(self, msg: str, *args, **kwargs) -> None:
+        self._logger.critical(msg, *args)
 
 
 # ---------------------------------------------------------------------------
@@ -7,18 +7,21 @@ Provides:
   - TimeEvent: timer event dataclass
   - TraderId: string subclass identifier
   - UUID4: uuid4 wrapper
-  - hmac_signature / rsa_signature / ed25519_signature: crypto helpers
+  - hmac_signature / hmac_signature_base64 / rsa_signature / ed25519_signature:
+    crypto helpers
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
 import hashlib
 import hmac as _hmac
 import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Callable
 
 
@@ -269,13 +272,28 @@ class MessageBus:
 # ---------------------------------------------------------------------------
 
 
-def hmac_signature(key: str, msg: str) -> str:
-    """Return HMAC-SHA256 hex digest of *msg* signed with *key*."""
-    return _hmac.new(
-        key.encode("utf-8"),
-        msg.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+@lru_cache(maxsize=None)
+def _hmac_sha256_prelude(key: str) -> _hmac.HMAC:
+    """Return an HMAC-SHA256 state that has already absorbed *key*."""
+    return _hmac.new(key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _hmac_sha256(key: str, msg: str, body: bytes | None) -> _hmac.HMAC:
+    mac = _hmac_sha256_prelude(key).copy()
+    mac.update(msg.encode("utf-8"))
+    if body:
+        mac.update(body)
+    return mac
+
+
+def hmac_signature(key: str, msg: str, body: bytes | None = None) -> str:
+    """Return HMAC-SHA256 hex digest of *msg* (followed by raw *body*) signed with *key*."""
+    return _hmac_sha256(key, msg, body).hexdigest()
+
+
+def hmac_signature_base64(key: str, msg: str, body: bytes | None = None) -> str:
+    """Return base-64–encoded HMAC-SHA256 digest of *msg* (followed by raw *body*)."""
+    return base64.b64encode(_hmac_sha256(key, msg, body).digest()).decode("ascii")
 
 
 def rsa_signature(key: str, msg: str) -> str:
@@ -32,6 +32,8 @@ from nexustrader.web.server import StrategyWebServer
 
 
 class Engine:
+    _CANCEL_ALL_CONCURRENCY = 10
+
     @staticmethod
     def set_loop_policy():
         # if python version < 3.13, using uvloop for non-Windows platform
@@ -442,7 +444,16 @@ class Engine:
             f"Cancelling {total_orders} open orders across {total_symbols} symbols..."
         )
 
-        # Cancel orders for each symbol
+        # Cancel orders for each symbol concurrently, bounded so a large book
+        # does not burst past the exchange rate limits
+        semaphore = asyncio.Semaphore(self._CANCEL_ALL_CONCURRENCY)
+
+        async def _cancel_symbol(connector, symbol: str):
+            async with semaphore:
+                await connector._oms.cancel_all_orders(symbol)
+
+        cancel_tasks = []
+        cancel_symbols = []
         for symbol, oids in symbol_to_orders.items():
             # Determine account type for this symbol
             instrument_id = InstrumentId.from_str(symbol)
@@ -461,7 +472,13 @@ class Engine:
 
             # Cancel all orders for this symbol
             self._log.debug(f"Cancelling {len(oids)} orders for {symbol}")
-            await connector._oms.cancel_all_orders(instrument_id.symbol)
+            cancel_tasks.append(_cancel_symbol(connector, instrument_id.symbol))
+            cancel_symbols.append(symbol)
+
+        results = await asyncio.gather(*cancel_tasks, return_exceptions=True)
+        for symbol, result in zip(cancel_symbols, results):
+            if isinstance(result, Exception):
+                self._log.error(f"Error cancelling orders for {symbol}: {result}")
 
         # Wait briefly for cancellations to be acknowledged
         await asyncio.sleep(0.1)
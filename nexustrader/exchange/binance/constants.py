@@ -222,13 +222,17 @@ class BinancePositionSide(Enum):
     SHORT = "SHORT"
 
     def parse_to_position_side(self) -> PositionSide:
-        if self == self.BOTH:
-            return PositionSide.FLAT
-        elif self == self.LONG:
-            return PositionSide.LONG
-        elif self == self.SHORT:
-            return PositionSide.SHORT
-        raise RuntimeError(f"Invalid position side: {self}")
+        side = _binance_position_side_map.get(self)
+        if side is None:
+            raise RuntimeError(f"Invalid position side: {self}")
+        return side
+
+
+_binance_position_side_map = {
+    BinancePositionSide.BOTH: PositionSide.FLAT,
+    BinancePositionSide.LONG: PositionSide.LONG,
+    BinancePositionSide.SHORT: PositionSide.SHORT,
+}
 
 
 class BinanceAccountType(AccountType):
@@ -1595,6 +1595,7 @@ class BinanceOrderManagementSystem(OrderManagementSystem):
                 batch_orders.append(params)
             try:
                 res = await self._execute_batch_order_request(batch_orders)
+                ts = self._clock.timestamp_ms()
                 for order, res_order in zip(orders, res):
                     if not res_order.code:
                         res_batch_order = Order(
@@ -1624,7 +1625,7 @@ class BinanceOrderManagementSystem(OrderManagementSystem):
                     else:
                         res_batch_order = Order(
                             exchange=self._exchange_id,
-                            timestamp=self._clock.timestamp_ms(),
+                            timestamp=ts,
                             oid=order.oid,
                             symbol=order.symbol,
                             type=order.type,
@@ -1646,10 +1647,11 @@ class BinanceOrderManagementSystem(OrderManagementSystem):
             except Exception as e:
                 error_msg = f"{e.__class__.__name__}: {str(e)}"
                 self._log.error(f"Error placing batch orders: {error_msg}")
+                ts = self._clock.timestamp_ms()
                 for order in orders:
                     res_batch_order = Order(
                         exchange=self._exchange_id,
-                        timestamp=self._clock.timestamp_ms(),
+                        timestamp=ts,
                         oid=order.oid,
                         symbol=order.symbol,
                         type=order.type,
@@ -1752,11 +1754,11 @@ class BinanceOrderManagementSystem(OrderManagementSystem):
     def _init_position(self):
         # NOTE: Implement in `_init_account_balance`, only portfolio margin need to implement this
         if self._account_type.is_portfolio_margin:
-            res_linear: list[BinancePortfolioMarginPositionRisk] = self._run_sync(
-                self._api_client.get_papi_v1_um_position_risk()
-            )
-            res_inverse: list[BinancePortfolioMarginPositionRisk] = self._run_sync(
-                self._api_client.get_papi_v1_cm_position_risk()
+            res_linear: list[BinancePortfolioMarginPositionRisk]
+            res_inverse: list[BinancePortfolioMarginPositionRisk]
+            res_linear, res_inverse = self._run_sync_all(
+                self._api_client.get_papi_v1_um_position_risk(),
+                self._api_client.get_papi_v1_cm_position_risk(),
             )
 
             active_symbols = set()
@@ -1792,11 +1794,9 @@ class BinanceOrderManagementSystem(OrderManagementSystem):
                 raise PositionModeError(error_msg)
 
         elif self._account_type.is_portfolio_margin:
-            res_linear = self._run_sync(
-                self._api_client.get_papi_v1_um_positionSide_dual()
-            )
-            res_inverse = self._run_sync(
-                self._api_client.get_papi_v1_cm_positionSide_dual()
+            res_linear, res_inverse = self._run_sync_all(
+                self._api_client.get_papi_v1_um_positionSide_dual(),
+                self._api_client.get_papi_v1_cm_positionSide_dual(),
             )
 
             if res_linear["dualSidePosition"]:
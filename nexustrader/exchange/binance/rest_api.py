@@ -3,10 +3,11 @@ import hashlib
 import msgspec
 
 from typing import Any, Dict
-from urllib.parse import urljoin, urlencode
+from urllib.parse import urljoin
 from curl_cffi import requests
 
 from nexustrader.base import ApiClient, RetryManager
+from nexustrader.base.api_client import encode_query
 from nexustrader.exchange.binance.schema import (
     BinanceOrder,
     BinanceListenKey,
@@ -158,7 +159,7 @@ class BinanceApiClient(ApiClient):
         payload = payload or {}
         if required_timestamp:
             payload["timestamp"] = self._clock.timestamp_ms()
-        payload = urlencode(payload)
+        payload = encode_query(payload)
 
         if signed:
             signature = self._generate_signature_v2(payload)
@@ -196,17 +197,8 @@ class BinanceApiClient(ApiClient):
                         message=error_msg.get("msg", "Unknown error"),
                     )
             return raw
-        except requests.exceptions.Timeout as e:
-            self._log.error(f"Timeout {method} {url} {e}")
-            raise
-        except requests.exceptions.ConnectionError as e:
-            self._log.error(f"Connection Error {method} {url} {e}")
-            raise
-        except requests.exceptions.HTTPError as e:
-            self._log.error(f"HTTP Error {method} {url} {e}")
-            raise
         except requests.exceptions.RequestException as e:
-            self._log.error(f"Request Error {method} {url} {e}")
+            self._log.error(f"{type(e).__name__} {method} {url} {e}")
             raise
         except Exception as e:
             self._log.error(f"Error {method} {url} {e}")
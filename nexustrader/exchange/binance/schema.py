@@ -383,7 +383,7 @@ class BinanceKline(msgspec.Struct):
     stream: str
 
 
-class BinanceTradeDataStream(msgspec.Struct):
+class BinanceTradeDataStream(msgspec.Struct, gc=False):
     e: BinanceWsEventType
     E: int
     s: str
@@ -774,7 +774,7 @@ class BinanceSpotOrderBookData(msgspec.Struct):
     asks: list["BinanceOrderBookDelta"]
 
 
-class BinanceOrderBookDelta(msgspec.Struct, array_like=True):
+class BinanceOrderBookDelta(msgspec.Struct, array_like=True, gc=False):
     """
     Schema of single ask/bid delta.
     """
@@ -44,6 +44,7 @@ class BinanceWSClient(WSClient):
             clock=clock,
             enable_auto_ping=False,
         )
+        self._request_id = 0
 
     def _send_payload(
         self, params: List[str], method: str = "SUBSCRIBE", chunk_size: int = 50
@@ -54,21 +55,21 @@ class BinanceWSClient(WSClient):
         ]
 
         for chunk in params_chunks:
+            self._request_id += 1
             payload = {
                 "method": method,
                 "params": chunk,
-                "id": self._clock.timestamp_ms(),
+                "id": self._request_id,
             }
             self._send(payload)
 
     async def _subscribe(self, params: List[str]):
-        params = [param for param in params if param not in self._subscriptions]
+        params = self._add_subscriptions(params)
 
         if not params:
             return
 
         for param in params:
-            self._subscriptions.append(param)
             self._log.debug(f"Subscribing to {param}...")
 
         await self.connect()
@@ -86,13 +87,12 @@ class BinanceWSClient(WSClient):
                 await asyncio.sleep(0.5)
 
     async def _unsubscribe(self, params: List[str]):
-        params = [param for param in params if param in self._subscriptions]
+        params = self._remove_subscriptions(params)
 
         if not params:
             return
 
         for param in params:
-            self._subscriptions.remove(param)
             self._log.debug(f"Unsubscribing from {param}...")
 
         await self.connect()
@@ -226,9 +226,10 @@ class BinanceWSClient(WSClient):
 
     async def _resubscribe(self):
         batch_size = 50
-        total = len(self._subscriptions)
+        subscriptions = list(self._subscriptions.values())
+        total = len(subscriptions)
         for i in range(0, total, batch_size):
-            chunk = self._subscriptions[i : i + batch_size]
+            chunk = subscriptions[i : i + batch_size]
             self._send_payload(chunk)
             if i + batch_size < total:
                 self._log.info(
@@ -228,12 +228,13 @@ class BitgetPositionSide(Enum):
         return self == BitgetPositionSide.NET
 
     def parse_to_position_side(self) -> PositionSide:
-        if self == self.LONG:
-            return PositionSide.LONG
-        elif self == self.SHORT:
-            return PositionSide.SHORT
-        else:
-            return PositionSide.FLAT
+        return _bitget_position_side_map.get(self, PositionSide.FLAT)
+
+
+_bitget_position_side_map = {
+    BitgetPositionSide.LONG: PositionSide.LONG,
+    BitgetPositionSide.SHORT: PositionSide.SHORT,
+}
 
 
 class BitgetEnumParser:
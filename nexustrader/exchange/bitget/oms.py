@@ -1545,7 +1545,7 @@ class BitgetOrderManagementSystem(OrderManagementSystem):
 
     def _handle_uta_order_event(self, raw: bytes):
         msg = self._ws_msg_uta_orders_decoder.decode(raw)
-        self._log.debug(f"Received UTA order event: {str(msg)}")
+        self._log.debug("Received UTA order event: {}", msg)
         for data in msg.data:
             tmp_order = self._registry.get_tmp_order(str(data.clientOid))
             if not tmp_order:
@@ -1614,7 +1614,7 @@ class BitgetOrderManagementSystem(OrderManagementSystem):
                 cum_cost=Decimal(data.cumExecValue or 0),
                 reduce_only=data.reduceOnly == "yes",
             )
-            self._log.debug(f"Order update: {str(order)}")
+            self._log.debug("Order update: {}", order)
             self.order_status_update(order)
 
     def _ws_msg_handler(self, raw: bytes):
@@ -1736,7 +1736,7 @@ class BitgetOrderManagementSystem(OrderManagementSystem):
 
     def _handle_orders_event(self, raw: bytes, arg: BitgetWsArgMsg):
         msg = self._ws_msg_orders_decoder.decode(raw)
-        self._log.debug(f"Received order event: {str(msg)}")
+        self._log.debug("Received order event: {}", msg)
         for data in msg.data:
             tmp_order = self._registry.get_tmp_order(str(data.clientOid))
             if not tmp_order:
@@ -1,9 +1,8 @@
 import msgspec
-import base64
 from typing import Any, Dict
-from urllib.parse import urlencode
 from curl_cffi import requests
 from nexustrader.base import ApiClient, RetryManager
+from nexustrader.base.api_client import encode_query
 from nexustrader.exchange.bitget.constants import (
     BitgetRateLimiter,
 )
@@ -11,7 +10,7 @@ from nexustrader.exchange.bitget.constants import (
 from nexustrader.exchange.bitget.schema import BitgetAccountAssetResponse
 from nexustrader.exchange.bitget.error import BitgetError
 from nexustrader.core.nautilius_core import (
-    hmac_signature,
+    hmac_signature_base64,
     LiveClock,
 )
 from nexustrader.exchange.bitget.schema import (
@@ -25,6 +24,7 @@ from nexustrader.exchange.bitget.schema import (
     BitgetKlineResponse,
     BitgetIndexPriceKlineResponse,
     BitgetGeneralResponse,
+    BitgetErrorResponse,
     BitgetTickerResponse,
     BitgetV3PositionResponse,
     BitgetFuturesOrderDetailResponse,
@@ -79,9 +79,17 @@ class BitgetApiClient(ApiClient):
         if api_key:
             self._headers["ACCESS-KEY"] = api_key
 
+        self._signed_headers = {
+            **self._headers,
+            "ACCESS-PASSPHRASE": passphrase,
+        }
+
         self._msg_decoder = msgspec.json.Decoder()
         self._msg_encoder = msgspec.json.Encoder()
         self._general_response_decoder = msgspec.json.Decoder(BitgetGeneralResponse)
+        self._error_response_decoder = msgspec.json.Decoder(
+            BitgetErrorResponse, strict=False
+        )
         self._cancel_order_decoder = msgspec.json.Decoder(BitgetOrderCancelResponse)
         self._order_response_decoder = msgspec.json.Decoder(BitgetOrderPlaceResponse)
         self._position_list_decoder = msgspec.json.Decoder(BitgetPositionListResponse)
@@ -113,28 +121,25 @@ class BitgetApiClient(ApiClient):
             BitgetSpotOrderDetailResponse
         )
 
-    def _generate_signature(self, message: str) -> str:
-        hex_digest = hmac_signature(self._secret, message)
-        digest = bytes.fromhex(hex_digest)
-        return base64.b64encode(digest).decode()
+    def _generate_signature(self, message: str, body: bytes | None = None) -> str:
+        return hmac_signature_base64(self._secret, message, body)
 
     def _get_signature(
         self,
         ts: int,
         method: str,
         request_path: str,
-        payload_json: str | None = None,
+        payload_json: bytes | None = None,
     ) -> str:
-        body = payload_json or ""
-        sign_str = f"{ts}{method}{request_path}{body}"
-        signature = self._generate_signature(sign_str)
+        sign_str = f"{ts}{method}{request_path}"
+        signature = self._generate_signature(sign_str, payload_json)
         return signature
 
     def _get_headers(
         self,
         method: str,
         request_path: str,
-        payload_json: str | None = None,
+        payload_json: bytes | None = None,
     ):
         ts = self._clock.timestamp_ms()
         signature = self._get_signature(
@@ -144,11 +149,9 @@ class BitgetApiClient(ApiClient):
             payload_json=payload_json,
         )
         return {
-            **self._headers,
-            "ACCESS-KEY": self._api_key,
+            **self._signed_headers,
             "ACCESS-SIGN": signature,
             "ACCESS-TIMESTAMP": str(ts),
-            "ACCESS-PASSPHRASE": self._passphrase,
         }
 
     async def _fetch(
@@ -182,9 +185,9 @@ class BitgetApiClient(ApiClient):
         payload = payload or {}
 
         payload_json = (
-            urlencode(payload)
+            encode_query(payload)
             if method == "GET"
-            else self._msg_encoder.encode(payload).decode("utf-8")
+            else self._msg_encoder.encode(payload)
         )
 
         if method == "GET":
@@ -200,9 +203,7 @@ class BitgetApiClient(ApiClient):
             )
 
         try:
-            self._log.debug(
-                f"{method} {request_path} Headers: {headers} payload: {payload_json}"
-            )
+            self._log.debug("{} {} payload: {}", method, request_path, payload_json)
 
             response = await self._session.request(
                 method=method, url=request_path, headers=headers, data=payload_json
@@ -210,26 +211,18 @@ class BitgetApiClient(ApiClient):
             raw = response.content
 
             if response.status_code >= 400:
-                error_message = self._msg_decoder.decode(raw)
-                code = error_message.get("code", response.status_code)
-                message = error_message.get("msg", f"HTTP Error {response.status_code}")
+                try:
+                    error = self._error_response_decoder.decode(raw)
+                except msgspec.DecodeError:
+                    error = BitgetErrorResponse()
 
                 raise BitgetError(
-                    code=code,
-                    message=message,
+                    code=response.status_code if error.code is None else error.code,
+                    message=error.msg or f"HTTP Error {response.status_code}",
                 )
             return raw
-        except requests.exceptions.Timeout as e:
-            self._log.error(f"Timeout {method} {request_path} {e}")
-            raise
-        except requests.exceptions.ConnectionError as e:
-            self._log.error(f"Connection Error {method} {request_path} {e}")
-            raise
-        except requests.exceptions.HTTPError as e:
-            self._log.error(f"HTTP Error {method} {request_path} {e}")
-            raise
         except requests.exceptions.RequestException as e:
-            self._log.error(f"Request Error {method} {request_path} {e}")
+            self._log.error(f"{type(e).__name__} {method} {request_path} {e}")
             raise
         except Exception as e:
             self._log.error(f"Error {method} {request_path} {e}")
@@ -45,6 +45,11 @@ class BitgetGeneralResponse(msgspec.Struct, kw_only=True):
     msg: str
 
 
+class BitgetErrorResponse(msgspec.Struct, kw_only=True):
+    code: int | None = None
+    msg: str | None = None
+
+
 class BitgetWsArgMsg(msgspec.Struct):
     instType: BitgetInstType
     channel: str
@@ -71,7 +76,7 @@ class BitgetWsGeneralMsg(msgspec.Struct, kw_only=True):
         return self.event is not None
 
 
-class BookData(msgspec.Struct, array_like=True):
+class BookData(msgspec.Struct, array_like=True, gc=False):
     px: str
     sz: str
 
@@ -86,7 +91,7 @@ class BitgetBooks1WsMsg(msgspec.Struct):
     data: list[BitgetBooks1WsMsgData]
 
 
-class BitgetTradeWsMsgData(msgspec.Struct):
+class BitgetTradeWsMsgData(msgspec.Struct, gc=False):
     p: str  # fill price
     S: BitgetOrderSide  # fill side
     T: str  # ts
@@ -126,18 +126,17 @@ class BitgetWSClient(WSClient):
             self._send(payload)
 
     async def _subscribe(self, params: List[Dict[str, Any]], auth: bool = False):
-        params = [param for param in params if param not in self._subscriptions]
+        params = self._add_subscriptions(params)
+        if not params:
+            return
 
         for param in params:
-            self._subscriptions.append(param)
             formatted_param = ".".join(param.values())
             self._log.debug(f"Subscribing to {formatted_param}...")
 
         await self.connect()
         if auth:
             await self._auth()
-        if not params:
-            return
 
         batch_size = 50
         total = len(params)
@@ -152,10 +151,9 @@ class BitgetWSClient(WSClient):
                 await asyncio.sleep(0.5)
 
     async def _unsubscribe(self, params: List[Dict[str, Any]]):
-        params = [param for param in params if param in self._subscriptions]
+        params = self._remove_subscriptions(params)
 
         for param in params:
-            self._subscriptions.remove(param)
             formatted_param = ".".join(param.values())
             self._log.debug(f"Unsubscribing from {formatted_param}...")
 
@@ -330,9 +328,10 @@ class BitgetWSClient(WSClient):
             self._auth_event = None
             await self._auth()
         batch_size = 50
-        total = len(self._subscriptions)
+        subscriptions = list(self._subscriptions.values())
+        total = len(subscriptions)
         for i in range(0, total, batch_size):
-            chunk = self._subscriptions[i : i + batch_size]
+            chunk = subscriptions[i : i + batch_size]
             self._send_payload(chunk)
             if i + batch_size < total:
                 self._log.info(
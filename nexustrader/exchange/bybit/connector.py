@@ -1,6 +1,6 @@
 import asyncio
 import msgspec
-from typing import Dict, List
+from typing import Callable, Dict, List
 from collections import defaultdict
 from nexustrader.base import PublicConnector, PrivateConnector
 from nexustrader.core.nautilius_core import MessageBus, LiveClock
@@ -96,6 +96,14 @@ class BybitPublicConnector(PublicConnector):
         self._bookl1_orderbook = defaultdict(BybitOrderBook)
         self._bookl2_orderbook = defaultdict(BybitOrderBook)
         self._ticker: Dict[str, BybitTicker] = defaultdict(BybitTicker)
+        # keyed by the topic without its trailing ".<symbol>"; kline topics carry
+        # the interval as well and are matched by prefix instead
+        self._ws_topic_handlers: Dict[str, Callable[[bytes], None]] = {
+            "orderbook.1": self._handle_orderbook,
+            "orderbook.50": self._handle_orderbook_50,
+            "publicTrade": self._handle_trade,
+            "tickers": self._handle_ticker,
+        }
 
     @property
     def market_type(self):
@@ -129,16 +137,12 @@ class BybitPublicConnector(PublicConnector):
                 self._log.error(f"WebSocket error: {ws_msg}")
                 return
 
-            if "orderbook.1" in ws_msg.topic:
-                self._handle_orderbook(raw)
-            elif "orderbook.50" in ws_msg.topic:
-                self._handle_orderbook_50(raw)
-            elif "publicTrade" in ws_msg.topic:
-                self._handle_trade(raw)
-            elif "kline" in ws_msg.topic:
+            topic = ws_msg.topic
+            handler = self._ws_topic_handlers.get(topic.rpartition(".")[0])
+            if handler is not None:
+                handler(raw)
+            elif topic.startswith("kline."):
                 self._handle_kline(raw)
-            elif "tickers" in ws_msg.topic:
-                self._handle_ticker(raw)
         except msgspec.DecodeError as e:
             self._log.error(f"Error decoding message: {str(raw)} {e}")
 
@@ -197,13 +197,17 @@ class BybitPositionSide(Enum):
     SELL = "Sell"
 
     def parse_to_position_side(self) -> PositionSide:
-        if self == self.FLAT:
-            return PositionSide.FLAT
-        elif self == self.BUY:
-            return PositionSide.LONG
-        elif self == self.SELL:
-            return PositionSide.SHORT
-        raise RuntimeError(f"Invalid position side: {self}")
+        side = _bybit_position_side_map.get(self)
+        if side is None:
+            raise RuntimeError(f"Invalid position side: {self}")
+        return side
+
+
+_bybit_position_side_map = {
+    BybitPositionSide.FLAT: PositionSide.FLAT,
+    BybitPositionSide.BUY: PositionSide.LONG,
+    BybitPositionSide.SELL: PositionSide.SHORT,
+}
 
 
 class BybitOrderType(Enum):
@@ -522,20 +522,18 @@ class BybitOrderManagementSystem(OrderManagementSystem):
         for result in res.result.list:
             self._cache._apply_balance(self._account_type, result.parse_to_balances())
 
-    def _get_all_positions_list(
+    async def _get_all_positions_list(
         self, category: BybitProductType, settle_coin: str | None = None
     ) -> list[BybitPositionStruct]:
         all_positions = []
         next_page_cursor = ""
 
         while True:
-            res = self._run_sync(
-                self._api_client.get_v5_position_list(
-                    category=category.value,
-                    settleCoin=settle_coin,
-                    limit=200,
-                    cursor=next_page_cursor,
-                )
+            res = await self._api_client.get_v5_position_list(
+                category=category.value,
+                settleCoin=settle_coin,
+                limit=200,
+                cursor=next_page_cursor,
             )
 
             all_positions.extend(res.result.list)
@@ -549,13 +547,11 @@ class BybitOrderManagementSystem(OrderManagementSystem):
         return all_positions
 
     def _init_position(self):
-        res_linear_usdt = self._get_all_positions_list(
-            BybitProductType.LINEAR, settle_coin="USDT"
-        )
-        res_linear_usdc = self._get_all_positions_list(
-            BybitProductType.LINEAR, settle_coin="USDC"
+        res_linear_usdt, res_linear_usdc, res_inverse = self._run_sync_all(
+            self._get_all_positions_list(BybitProductType.LINEAR, settle_coin="USDT"),
+            self._get_all_positions_list(BybitProductType.LINEAR, settle_coin="USDC"),
+            self._get_all_positions_list(BybitProductType.INVERSE),
         )
-        res_inverse = self._get_all_positions_list(BybitProductType.INVERSE)
 
         active_symbols = set()
         active_symbols.update(
@@ -795,6 +791,7 @@ class BybitOrderManagementSystem(OrderManagementSystem):
             res = await self._api_client.post_v5_order_create_batch(
                 category=category, request=batch_orders
             )
+            ts = self._clock.timestamp_ms()
             for order, res_order, res_ext in zip(
                 orders, res.result.list, res.retExtInfo.list
             ):
@@ -818,7 +815,7 @@ class BybitOrderManagementSystem(OrderManagementSystem):
                 else:
                     res_batch_order = Order(
                         exchange=self._exchange_id,
-                        timestamp=self._clock.timestamp_ms(),
+                        timestamp=ts,
                         symbol=order.symbol,
                         type=order.type,
                         oid=order.oid,
@@ -840,10 +837,11 @@ class BybitOrderManagementSystem(OrderManagementSystem):
         except Exception as e:
             error_msg = f"{e.__class__.__name__}: {str(e)}"
             self._log.error(f"Error creating batch orders: {error_msg}")
+            ts = self._clock.timestamp_ms()
             for order in orders:
                 res_batch_order = Order(
                     exchange=self._exchange_id,
-                    timestamp=self._clock.timestamp_ms(),
+                    timestamp=ts,
                     symbol=order.symbol,
                     oid=order.oid,
                     type=order.type,
@@ -1237,7 +1235,7 @@ class BybitOrderManagementSystem(OrderManagementSystem):
 
     def _parse_order_update(self, raw: bytes):
         order_msg = self._ws_msg_order_update_decoder.decode(raw)
-        self._log.debug(f"Order update: {str(order_msg)}")
+        self._log.debug("Order update: {}", order_msg)
         for data in order_msg.data:
             category = data.category
             if category.is_spot:
@@ -2,10 +2,11 @@ import hmac
 import hashlib
 import msgspec
 from typing import Any, Dict, List
-from urllib.parse import urljoin, urlencode
+from urllib.parse import urljoin
 from curl_cffi import requests
 from decimal import Decimal
 from nexustrader.base import ApiClient, RetryManager
+from nexustrader.base.api_client import encode_query
 from nexustrader.exchange.bybit.constants import (
     BybitBaseUrl,
     BybitRateLimiter,
@@ -102,6 +103,11 @@ class BybitApiClient(ApiClient):
         if api_key:
             self._headers["X-BAPI-API-KEY"] = api_key
 
+        self._signed_headers = {
+            **self._headers,
+            "X-BAPI-RECV-WINDOW": str(self._recv_window),
+        }
+
         self._msg_decoder = msgspec.json.Decoder()
         self._msg_encoder = msgspec.json.Encoder()
         self._response_decoder = msgspec.json.Decoder(BybitResponse)
@@ -138,10 +144,12 @@ class BybitApiClient(ApiClient):
         signature = hash.hexdigest()
         return [signature, timestamp]
 
-    def _generate_signature_v2(self, payload: str) -> List[str]:
+    def _generate_signature_v2(
+        self, query: str = "", body: bytes | None = None
+    ) -> List[str]:
         timestamp = str(self._timestamp_ms())
-        param = f"{timestamp}{self._api_key}{self._recv_window}{payload}"
-        signature = hmac_signature(self._secret, param)  # return hex digest string
+        param = f"{timestamp}{self._api_key}{self._recv_window}{query}"
+        signature = hmac_signature(self._secret, param, body)  # hex digest string
         return [signature, timestamp]
 
     async def _sync_time_if_needed(self):
@@ -225,34 +233,33 @@ class BybitApiClient(ApiClient):
         url = urljoin(base_url, endpoint)
         payload = payload or {}
 
-        payload_str = (
-            urlencode(payload)
-            if method == "GET"
-            else self._msg_encoder.encode(payload).decode("utf-8")
-        )
+        if method == "GET":
+            query = encode_query(payload)
+            data = None
+        else:
+            query = ""
+            data = self._msg_encoder.encode(payload)
 
         headers = self._headers
         if signed:
             await self._sync_time_if_needed()
-            signature, timestamp = self._generate_signature_v2(payload_str)
+            signature, timestamp = self._generate_signature_v2(query, data)
             headers = {
-                **headers,
+                **self._signed_headers,
                 "X-BAPI-TIMESTAMP": timestamp,
                 "X-BAPI-SIGN": signature,
-                "X-BAPI-RECV-WINDOW": str(self._recv_window),
             }
 
         if method == "GET":
-            url += f"?{payload_str}"
-            payload_str = None
+            url += f"?{query}"
 
         try:
-            self._log.debug(f"Request: {url} {payload_str}")
+            self._log.debug("Request: {} {}", url, data)
             response = await self._session.request(
                 method=method,
                 url=url,
                 headers=headers,
-                data=payload_str,
+                data=data,
             )
             raw = response.content
             if response.status_code >= 400:
@@ -268,17 +275,8 @@ class BybitApiClient(ApiClient):
                     code=bybit_response.retCode,
                     message=bybit_response.retMsg,
                 )
-        except requests.exceptions.Timeout as e:
-            self._log.error(f"Timeout {method} Url: {url} - {e}")
-            raise
-        except requests.exceptions.ConnectionError as e:
-            self._log.error(f"Connection Error {method} Url: {url} - {e}")
-            raise
-        except requests.exceptions.HTTPError as e:
-            self._log.error(f"HTTP Error {method} Url: {url} - {e}")
-            raise
         except requests.exceptions.RequestException as e:
-            self._log.error(f"Request Error {method} Url: {url} - {e}")
+            self._log.error(f"{type(e).__name__} {method} Url: {url} - {e}")
             raise
         except Exception as e:
             self._log.error(f"Error {method} Url: {url} - {e}")
@@ -385,7 +385,7 @@ class BybitOrderBook(msgspec.Struct):
         }
 
 
-class BybitWsTrade(msgspec.Struct):
+class BybitWsTrade(msgspec.Struct, gc=False):
     # The timestamp (ms) that the order is filled
     T: int
     # Symbol name
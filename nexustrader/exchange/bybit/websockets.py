@@ -15,6 +15,9 @@ from nexustrader.exchange.bybit.constants import (
 )
 
 
+_ws_msg_general_decoder = msgspec.json.Decoder(BybitWsMessageGeneral)
+
+
 def user_pong_callback(self, frame: picows.WSFrame) -> bool:
     if frame.msg_type != picows.WSMsgType.TEXT:
         self._log.debug(
@@ -23,9 +26,13 @@ def user_pong_callback(self, frame: picows.WSFrame) -> bool:
         return False
 
     raw = frame.get_payload_as_bytes()
+    # picows asks about every frame while a pong is outstanding; skip the JSON
+    # decode for frames that cannot be one
+    if b"pong" not in raw:
+        return False
     try:
-        message = msgspec.json.decode(raw, type=BybitWsMessageGeneral)
-        self._log.debug(f"Received pong message: {message}")
+        message = _ws_msg_general_decoder.decode(raw)
+        self._log.debug("Received pong message: {}", message)
         return message.is_pong
     except msgspec.DecodeError:
         self._log.error(
@@ -42,9 +49,13 @@ def user_api_pong_callback(self, frame: picows.WSFrame) -> bool:
         return False
 
     raw = frame.get_payload_as_bytes()
+    # picows asks about every frame while a pong is outstanding; skip the JSON
+    # decode for frames that cannot be one
+    if b"pong" not in raw:
+        return False
     try:
-        message = msgspec.json.decode(raw, type=BybitWsMessageGeneral)
-        self._log.debug(f"Received pong message: {message}")
+        message = _ws_msg_general_decoder.decode(raw)
+        self._log.debug("Received pong message: {}", message)
         return message.is_pong
     except msgspec.DecodeError:
         self._log.error(
@@ -128,17 +139,16 @@ class BybitWSClient(WSClient):
             self._send(payload)
 
     async def _subscribe(self, topics: List[str], auth: bool = False):
-        topics = [topic for topic in topics if topic not in self._subscriptions]
+        topics = self._add_subscriptions(topics)
+        if not topics:
+            return
 
         for topic in topics:
-            self._subscriptions.append(topic)
             self._log.debug(f"Subscribing to {topic}...")
 
         await self.connect()
         if auth:
             await self._auth()
-        if not topics:
-            return
 
         batch_size = 50
         total = len(topics)
@@ -153,10 +163,9 @@ class BybitWSClient(WSClient):
                 await asyncio.sleep(0.5)
 
     async def _unsubscribe(self, topics: List[str]):
-        topics = [topic for topic in topics if topic in self._subscriptions]
+        topics = self._remove_subscriptions(topics)
 
         for topic in topics:
-            self._subscriptions.remove(topic)
             self._log.debug(f"Unsubscribing from {topic}...")
 
         await self.connect()
@@ -211,9 +220,10 @@ class BybitWSClient(WSClient):
             self._auth_event = None
             await self._auth()
         batch_size = 50
-        total = len(self._subscriptions)
+        subscriptions = list(self._subscriptions.values())
+        total = len(subscriptions)
         for i in range(0, total, batch_size):
-            chunk = self._subscriptions[i : i + batch_size]
+            chunk = subscriptions[i : i + batch_size]
             self._send_payload(chunk)
             if i + batch_size < total:
                 self._log.info(
@@ -439,6 +439,7 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
         """Create a batch of orders"""
 
         batch_orders: List[HyperLiquidOrderRequest] = []
+        ts = self._clock.timestamp_ms()
         for order in orders:
             self._registry.register_tmp_order(
                 order=Order(
@@ -450,7 +451,7 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
                     type=order.type,
                     price=float(order.price) if order.price else None,
                     time_in_force=order.time_in_force,
-                    timestamp=self._clock.timestamp_ms(),
+                    timestamp=ts,
                     reduce_only=order.reduce_only,
                 )
             )
@@ -498,6 +499,7 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
 
         try:
             res = await self._api_client.place_orders(orders=batch_orders)
+            ts = self._clock.timestamp_ms()
             for order, status in zip(orders, res.response.data.statuses):
                 if status.error:
                     error_msg = status.error
@@ -507,7 +509,7 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
                     res_batch_order = Order(
                         oid=order.oid,
                         exchange=self._exchange_id,
-                        timestamp=self._clock.timestamp_ms(),
+                        timestamp=ts,
                         symbol=order.symbol,
                         type=order.type,
                         side=order.side,
@@ -524,7 +526,7 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
                     order_status = status.resting or status.filled
                     res_batch_order = Order(
                         exchange=self._exchange_id,
-                        timestamp=self._clock.timestamp_ms(),
+                        timestamp=ts,
                         eid=str(order_status.oid),
                         oid=order.oid,
                         symbol=order.symbol,
@@ -544,10 +546,11 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
         except Exception as e:
             error_msg = f"{e.__class__.__name__}: {str(e)}"
             self._log.error(f"Error creating batch orders: {error_msg}")
+            ts = self._clock.timestamp_ms()
             for order in orders:
                 order = Order(
                     exchange=self._exchange_id,
-                    timestamp=self._clock.timestamp_ms(),
+                    timestamp=ts,
                     symbol=order.symbol,
                     oid=order.oid,
                     type=order.type,
@@ -1237,7 +1240,7 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
         order_msg: HyperLiquidWsOrderUpdatesMsg = (
             self._ws_msg_order_updates_decoder.decode(raw)
         )
-        self._log.debug(f"Order update received: {str(order_msg)}")
+        self._log.debug("Order update received: {}", order_msg)
 
         for data in order_msg.data:
             tmp_order = self._registry.get_tmp_order(data.order.cloid)
@@ -1263,5 +1266,5 @@ class HyperLiquidOrderManagementSystem(OrderManagementSystem):
                 timestamp=data.order.timestamp,
                 reduce_only=tmp_order.reduce_only,
             )
-            self._log.debug(f"Parsed order: {str(order)}")
+            self._log.debug("Parsed order: {}", order)
             self.order_status_update(order)
@@ -106,7 +106,7 @@ class HyperLiquidApiClient(ApiClient):
         self._init_session()
 
         url = urljoin(base_url, endpoint)
-        data = msgspec.json.encode(payload)
+        data = self._msg_encoder.encode(payload)
 
         self._log.debug(f"Request: {method} {url}")
 
@@ -127,17 +127,8 @@ class HyperLiquidApiClient(ApiClient):
                 )
 
             return raw
-        except requests.exceptions.Timeout as e:
-            self._log.error(f"Timeout {method} {url} {e}")
-            raise
-        except requests.exceptions.ConnectionError as e:
-            self._log.error(f"Connection Error {method} {url} {e}")
-            raise
-        except requests.exceptions.HTTPError as e:
-            self._log.error(f"HTTP Error {method} {url} {e}")
-            raise
         except requests.exceptions.RequestException as e:
-            self._log.error(f"Request Error {method} {url} {e}")
+            self._log.error(f"{type(e).__name__} {method} {url} {e}")
             raise
         except Exception as e:
             self._log.error(f"Error {method} {url} {e}")
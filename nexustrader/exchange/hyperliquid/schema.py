@@ -441,7 +441,7 @@ class HyperLiquidWsMessageGeneral(msgspec.Struct):
     channel: str  # Channel name
 
 
-class HyperLiquidWsBboLevelMsgData(msgspec.Struct):
+class HyperLiquidWsBboLevelMsgData(msgspec.Struct, gc=False):
     px: str  # Price
     sz: str  # Size
     n: int  # Number of orders
@@ -471,7 +471,7 @@ class HyperLiquidWsBboMsg(msgspec.Struct):
     data: HyperLiquidWsBboMsgData
 
 
-class HyperLiquidWsTradeDataMsg(msgspec.Struct):
+class HyperLiquidWsTradeDataMsg(msgspec.Struct, gc=False):
     coin: str
     px: str  # Price
     side: HyperLiquidOrderSide  # "A" for ask/sell, "B" for bid/buy
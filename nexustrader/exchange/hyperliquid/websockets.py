@@ -21,13 +21,20 @@ from nexustrader.exchange.hyperliquid.constants import (
 )
 
 
+_ws_msg_general_decoder = msgspec.json.Decoder(HyperLiquidWsMessageGeneral)
+
+
 def user_api_pong_callback(self, frame: picows.WSFrame) -> bool:
     if frame.msg_type != picows.WSMsgType.TEXT:
         return False
 
     raw = frame.get_payload_as_bytes()
+    # picows asks about every frame while a pong is outstanding; skip the JSON
+    # decode for frames that cannot be one
+    if b"pong" not in raw:
+        return False
     try:
-        message = msgspec.json.decode(raw, type=HyperLiquidWsMessageGeneral)
+        message = _ws_msg_general_decoder.decode(raw)
         return message.channel == "pong"
     except msgspec.DecodeError:
         return False
@@ -65,10 +72,11 @@ class HyperLiquidWSClient(WSClient):
         )
 
     async def _subscribe(self, msgs: List[Dict[str, str]]):
-        msgs = [msg for msg in msgs if msg not in self._subscriptions]
+        msgs = self._add_subscriptions(msgs)
+        if not msgs:
+            return
         await self.connect()
         for msg in msgs:
-            self._subscriptions.append(msg)
             format_msg = ".".join(msg.values())
             self._log.debug(f"Subscribing to {format_msg}...")
 
@@ -91,10 +99,9 @@ class HyperLiquidWSClient(WSClient):
                 await asyncio.sleep(0.5)
 
     async def _unsubscribe(self, msgs: List[Dict[str, str]]):
-        msgs = [msg for msg in msgs if msg in self._subscriptions]
+        msgs = self._remove_subscriptions(msgs)
         await self.connect()
         for msg in msgs:
-            self._subscriptions.remove(msg)
             format_msg = ".".join(msg.values())
             self._log.debug(f"Unsubscribing from {format_msg}...")
             self._send(
@@ -106,9 +113,10 @@ class HyperLiquidWSClient(WSClient):
 
     async def _resubscribe(self):
         batch_size = 50
-        total = len(self._subscriptions)
+        subscriptions = list(self._subscriptions.values())
+        total = len(subscriptions)
         for i in range(0, total, batch_size):
-            chunk = self._subscriptions[i : i + batch_size]
+            chunk = subscriptions[i : i + batch_size]
             for msg in chunk:
                 self._send(
                     {
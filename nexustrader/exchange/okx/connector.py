@@ -1,6 +1,6 @@
 import asyncio
 import msgspec
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 
 from nexustrader.exchange.okx import OkxAccountType
@@ -101,6 +101,14 @@ class OkxPublicConnector(PublicConnector):
         self._ws_msg_index_ticker_decoder = msgspec.json.Decoder(OkxWsIndexTickerMsg)
         self._ws_msg_mark_price_decoder = msgspec.json.Decoder(OkxWsMarkPriceMsg)
         self._ws_msg_funding_rate_decoder = msgspec.json.Decoder(OkxWsFundingRateMsg)
+        self._ws_channel_handlers: Dict[str, Callable[[bytes], None]] = {
+            "bbo-tbt": self._handle_bbo_tbt,
+            "trades": self._handle_trade,
+            "books5": self._handle_book5,
+            "index-ticker": self._handle_index_ticker,
+            "mark-price": self._handle_mark_price,
+            "funding-rate": self._handle_funding_rate,
+        }
 
     def request_ticker(
         self,
@@ -590,20 +598,11 @@ class OkxPublicConnector(PublicConnector):
                 self._handle_event_msg(ws_msg)
             else:
                 channel: str = ws_msg.arg.channel
-                if channel == "bbo-tbt":
-                    self._handle_bbo_tbt(raw)
-                elif channel == "trades":
-                    self._handle_trade(raw)
+                handler = self._ws_channel_handlers.get(channel)
+                if handler is not None:
+                    handler(raw)
                 elif channel.startswith("candle"):
                     self._handle_kline(raw)
-                elif channel == "books5":
-                    self._handle_book5(raw)
-                elif channel == "index-ticker":
-                    self._handle_index_ticker(raw)
-                elif channel == "mark-price":
-                    self._handle_mark_price(raw)
-                elif channel == "funding-rate":
-                    self._handle_funding_rate(raw)
         except msgspec.DecodeError as e:
             self._log.error(f"Error decoding message: {str(raw)} {e}")
 
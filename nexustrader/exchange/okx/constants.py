@@ -1,4 +1,6 @@
+from decimal import Decimal
 from enum import Enum, unique
+from functools import lru_cache
 from throttled.asyncio import Throttled, rate_limiter, RateLimiterType
 from throttled import Throttled as ThrottledSync
 from throttled import rate_limiter as rate_limiter_sync
@@ -195,13 +197,17 @@ class OkxPositionSide(Enum):
     NONE = ""
 
     def parse_to_position_side(self) -> PositionSide:
-        if self == self.NET:
-            return PositionSide.FLAT
-        elif self == self.LONG:
-            return PositionSide.LONG
-        elif self == self.SHORT:
-            return PositionSide.SHORT
-        raise RuntimeError(f"Invalid position side: {self}")
+        side = _okx_position_side_map.get(self)
+        if side is None:
+            raise RuntimeError(f"Invalid position side: {self}")
+        return side
+
+
+_okx_position_side_map = {
+    OkxPositionSide.NET: PositionSide.FLAT,
+    OkxPositionSide.LONG: PositionSide.LONG,
+    OkxPositionSide.SHORT: PositionSide.SHORT,
+}
 
 
 @unique
@@ -290,6 +296,22 @@ class OkxEnumParser:
         OkxOrderSide.SELL: OrderSide.SELL,
     }
 
+    _okx_order_type_map = {
+        OkxOrderType.MARKET: OrderType.MARKET,
+        OkxOrderType.LIMIT: OrderType.LIMIT,
+        OkxOrderType.IOC: OrderType.LIMIT,
+        OkxOrderType.FOK: OrderType.LIMIT,
+        OkxOrderType.POST_ONLY: OrderType.POST_ONLY,
+    }
+
+    _okx_time_in_force_map = {
+        OkxOrderType.MARKET: TimeInForce.GTC,
+        OkxOrderType.LIMIT: TimeInForce.GTC,
+        OkxOrderType.POST_ONLY: TimeInForce.GTC,
+        OkxOrderType.FOK: TimeInForce.FOK,
+        OkxOrderType.IOC: TimeInForce.IOC,
+    }
+
     # Add reverse mapping dictionaries
     _order_status_to_okx_map = {v: k for k, v in _okx_order_status_map.items()}
     _position_side_to_okx_map = {
@@ -301,6 +323,11 @@ class OkxEnumParser:
 
     _kline_interval_to_okx_map = {v: k for k, v in _okx_kline_interval_map.items()}
     _trigger_type_to_okx_map = {v: k for k, v in _okx_trigger_type_map.items()}
+    _time_in_force_to_okx_order_type_map = {
+        TimeInForce.GTC: OkxOrderType.LIMIT,  # OKX limit orders are GTC by default
+        TimeInForce.FOK: OkxOrderType.FOK,
+        TimeInForce.IOC: OkxOrderType.IOC,
+    }
 
     @classmethod
     def parse_trigger_type(cls, trigger_type: OkxTriggerType) -> TriggerType:
@@ -326,39 +353,21 @@ class OkxEnumParser:
     @classmethod
     def parse_order_type(cls, ordType: OkxOrderType) -> OrderType:
         # TODO add parameters in future to enable parsing of all other nautilus OrderType's
-        match ordType:
-            case OkxOrderType.MARKET:
-                return OrderType.MARKET
-            case OkxOrderType.LIMIT:
-                return OrderType.LIMIT
-            case OkxOrderType.IOC:
-                return OrderType.LIMIT
-            case OkxOrderType.FOK:
-                return OrderType.LIMIT
-            case OkxOrderType.POST_ONLY:
-                return OrderType.POST_ONLY
-            case _:
-                raise NotImplementedError(
-                    f"Cannot parse OrderType from OKX order type {ordType}"
-                )
+        order_type = cls._okx_order_type_map.get(ordType)
+        if order_type is None:
+            raise NotImplementedError(
+                f"Cannot parse OrderType from OKX order type {ordType}"
+            )
+        return order_type
 
     @classmethod
     def parse_time_in_force(cls, ordType: OkxOrderType) -> TimeInForce:
-        match ordType:
-            case OkxOrderType.MARKET:
-                return TimeInForce.GTC
-            case OkxOrderType.LIMIT:
-                return TimeInForce.GTC
-            case OkxOrderType.POST_ONLY:
-                return TimeInForce.GTC
-            case OkxOrderType.FOK:
-                return TimeInForce.FOK
-            case OkxOrderType.IOC:
-                return TimeInForce.IOC
-            case _:
-                raise NotImplementedError(
-                    f"Cannot parse TimeInForce from OKX order type {ordType}"
-                )
+        time_in_force = cls._okx_time_in_force_map.get(ordType)
+        if time_in_force is None:
+            raise NotImplementedError(
+                f"Cannot parse TimeInForce from OKX order type {ordType}"
+            )
+        return time_in_force
 
     @classmethod
     def to_okx_order_status(cls, status: OrderStatus) -> OkxOrderStatus:
@@ -385,17 +394,12 @@ class OkxEnumParser:
         elif order_type == OrderType.POST_ONLY:
             return OkxOrderType.POST_ONLY
 
-        match time_in_force:
-            case TimeInForce.GTC:
-                return OkxOrderType.LIMIT  # OKX limit orders are GTC by default
-            case TimeInForce.FOK:
-                return OkxOrderType.FOK
-            case TimeInForce.IOC:
-                return OkxOrderType.IOC
-            case _:
-                raise RuntimeError(
-                    f"Could not determine OKX order type from order_type {order_type} and time_in_force {time_in_force}, valid OKX order types are: {list(OkxOrderType)}",
-                )
+        okx_order_type = cls._time_in_force_to_okx_order_type_map.get(time_in_force)
+        if okx_order_type is None:
+            raise RuntimeError(
+                f"Could not determine OKX order type from order_type {order_type} and time_in_force {time_in_force}, valid OKX order types are: {list(OkxOrderType)}",
+            )
+        return okx_order_type
 
     @classmethod
     def to_okx_kline_interval(cls, interval: KlineInterval) -> OkxKlineInterval:
@@ -564,3 +568,9 @@ def restore_uuid_hyphens(uuid_str: str) -> str:
     if len(uuid_str) != 32:
         return uuid_str  # Return as-is if not a valid stripped UUID
     return f"{uuid_str[:8]}-{uuid_str[8:12]}-{uuid_str[12:16]}-{uuid_str[16:20]}-{uuid_str[20:]}"
+
+
+@lru_cache(maxsize=None)
+def contract_value(ct_val: str) -> Decimal:
+    """Return the instrument's ``ctVal`` as a Decimal, parsed once per distinct value."""
+    return Decimal(ct_val)
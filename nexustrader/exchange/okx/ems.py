@@ -9,6 +9,7 @@ from nexustrader.core.entity import TaskManager
 from nexustrader.core.registry import OrderRegistry
 from nexustrader.exchange.okx import OkxAccountType
 from nexustrader.exchange.okx.schema import OkxMarket
+from nexustrader.exchange.okx.constants import contract_value
 from nexustrader.base import ExecutionManagementSystem
 from nexustrader.schema import CancelAllOrderSubmit, CancelOrderSubmit
 
@@ -100,7 +101,7 @@ class OkxExecutionManagementSystem(ExecutionManagementSystem):
 
         if not market.spot:
             # for linear and inverse, the min order amount is contract size and ctVal is base amount per contract
-            min_order_amount *= Decimal(market.info.ctVal)
+            min_order_amount *= contract_value(market.info.ctVal)
 
         return min_order_amount
 
@@ -114,7 +115,7 @@ class OkxExecutionManagementSystem(ExecutionManagementSystem):
         market = self._market[symbol]
         ctVal = Decimal("1")
         if not market.spot:
-            ctVal = Decimal(market.info.ctVal)
+            ctVal = contract_value(market.info.ctVal)
             amount = Decimal(str(amount)) / ctVal
         return super()._amount_to_precision(symbol, amount, mode) * ctVal
 
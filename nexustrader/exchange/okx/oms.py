@@ -43,6 +43,7 @@ from nexustrader.constants import OrderSide, OrderType
 from nexustrader.exchange.okx.constants import (
     OkxTdMode,
     OkxEnumParser,
+    contract_value,
 )
 from nexustrader.base import OrderManagementSystem
 from nexustrader.core.registry import OrderRegistry
@@ -340,7 +341,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
     def _order_data_to_order(self, symbol: str, data) -> Order:
         market = self._market[symbol]
         if not market.spot:
-            ct_val = Decimal(market.info.ctVal)
+            ct_val = contract_value(market.info.ctVal)
         else:
             ct_val = Decimal("1")
         return Order(
@@ -417,7 +418,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
             market = self._market[symbol]
 
             if market.info.ctVal:
-                ct_val = Decimal(market.info.ctVal)
+                ct_val = contract_value(market.info.ctVal)
             else:
                 ct_val = Decimal("1")
 
@@ -474,14 +475,14 @@ class OkxOrderManagementSystem(OrderManagementSystem):
 
     def _handle_orders(self, raw: bytes):
         msg: OkxWsOrderMsg = self._decoder_ws_order_msg.decode(raw)
-        self._log.debug(f"Order update: {str(msg)}")
+        self._log.debug("Order update: {}", msg)
         for data in msg.data:
             symbol = self._market_id[data.instId]
 
             market = self._market[symbol]
 
             if not market.spot:
-                ct_val = Decimal(market.info.ctVal)  # contract size
+                ct_val = contract_value(market.info.ctVal)  # contract size
             else:
                 ct_val = Decimal("1")
 
@@ -524,7 +525,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
             market = self._market[symbol]
 
             if market.info.ctVal:
-                ct_val = Decimal(market.info.ctVal)
+                ct_val = contract_value(market.info.ctVal)
             else:
                 ct_val = Decimal("1")
 
@@ -607,7 +608,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
             td_mode = OkxTdMode(td_mode)
 
         if not market.spot:
-            ct_val = Decimal(market.info.ctVal)  # contract size
+            ct_val = contract_value(market.info.ctVal)  # contract size
             sz = format(amount / ct_val, "f")
         else:
             sz = str(amount)
@@ -730,7 +731,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
                 td_mode = OkxTdMode(td_mode)
 
             if not market.spot:
-                ct_val = Decimal(market.info.ctVal)
+                ct_val = contract_value(market.info.ctVal)
                 sz = format(order.amount / ct_val, "f")
             else:
                 sz = str(order.amount)
@@ -777,6 +778,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
             res = await self._api_client.post_api_v5_trade_batch_orders(
                 payload=batch_orders
             )
+            ts = self._clock.timestamp_ms()
             for order, res_order in zip(orders, res.data):
                 if res_order.sCode == "0":
                     order_result = Order(
@@ -799,7 +801,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
                     order_result = Order(
                         exchange=self._exchange_id,
                         oid=order.oid,
-                        timestamp=self._clock.timestamp_ms(),
+                        timestamp=ts,
                         symbol=order.symbol,
                         type=order.type,
                         side=order.side,
@@ -822,10 +824,11 @@ class OkxOrderManagementSystem(OrderManagementSystem):
             self._log.error(
                 f"Error creating batch orders: {error_msg} params: {str(orders)}"
             )
+            ts = self._clock.timestamp_ms()
             for order in orders:
                 order_result = Order(
                     exchange=self._exchange_id,
-                    timestamp=self._clock.timestamp_ms(),
+                    timestamp=ts,
                     symbol=order.symbol,
                     oid=order.oid,
                     type=order.type,
@@ -881,7 +884,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
             td_mode = OkxTdMode(td_mode)
 
         if not market.spot:
-            ct_val = Decimal(market.info.ctVal)  # contract size
+            ct_val = contract_value(market.info.ctVal)  # contract size
             sz = format(amount / ct_val, "f")
         else:
             sz = str(amount)
@@ -1000,7 +1003,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
             td_mode = OkxTdMode(td_mode)
 
         if not market.spot:
-            ct_val = Decimal(market.info.ctVal)  # contract size
+            ct_val = contract_value(market.info.ctVal)  # contract size
             sz = format(amount / ct_val, "f")
         else:
             sz = str(amount)
@@ -1181,7 +1184,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
         inst_id = market.id
 
         if not market.spot:
-            ct_val = Decimal(market.info.ctVal)  # contract size
+            ct_val = contract_value(market.info.ctVal)  # contract size
             sz = format(amount / ct_val, "f") if amount else None
         else:
             sz = str(amount) if amount else None
@@ -1309,7 +1312,7 @@ class OkxOrderManagementSystem(OrderManagementSystem):
 
             data = res.data[0]
             if not market.spot:
-                ct_val = Decimal(market.info.ctVal)  # type: ignore
+                ct_val = contract_value(market.info.ctVal)  # type: ignore
             else:
                 ct_val = Decimal("1")
             order = Order(
@@ -1,11 +1,10 @@
 import msgspec
 from typing import Dict, Any
-import base64
-from urllib.parse import urlencode
 
 # from curl_cffi import requests
 from curl_cffi.requests import exceptions as CurlCffiExceptions
 from nexustrader.base import ApiClient, RetryManager
+from nexustrader.base.api_client import encode_query
 from nexustrader.exchange.okx.constants import (
     OkxRateLimiter,
 )
@@ -34,7 +33,7 @@ from nexustrader.exchange.okx.schema import (
     OkxTickersResponse,
     OkxOrderResponse,
 )
-from nexustrader.core.nautilius_core import hmac_signature, LiveClock
+from nexustrader.core.nautilius_core import hmac_signature_base64, LiveClock
 
 
 class OkxApiClient(ApiClient):
@@ -141,6 +140,8 @@ class OkxApiClient(ApiClient):
             OkxOrderResponse, strict=False
         )
 
+        self._msg_encoder = msgspec.json.Encoder()
+
         self._headers = {
             "Content-Type": "application/json",
             "User-Agent": "TradingBot/1.0",
@@ -149,6 +150,12 @@ class OkxApiClient(ApiClient):
         if self._testnet:
             self._headers["x-simulated-trading"] = "1"
 
+        self._signed_headers = {
+            **self._headers,
+            "OK-ACCESS-KEY": self._api_key,
+            "OK-ACCESS-PASSPHRASE": self._passphrase,
+        }
+
     async def get_api_v5_account_balance(
         self, ccy: str | None = None
     ) -> OkxBalanceResponse:
@@ -540,17 +547,14 @@ class OkxApiClient(ApiClient):
         raw = await self._fetch("GET", endpoint, signed=True)
         return self._account_config_response_decoder.decode(raw)
 
-    def _generate_signature(self, message: str) -> str:
-        hex_digest = hmac_signature(self._secret, message)
-        digest = bytes.fromhex(hex_digest)
-        return base64.b64encode(digest).decode()
+    def _generate_signature(self, message: str, body: bytes | None = None) -> str:
+        return hmac_signature_base64(self._secret, message, body)
 
     def _get_signature(
         self, ts: str, method: str, request_path: str, payload: bytes
     ) -> str:
-        body = payload.decode() if payload else ""
-        sign_str = f"{ts}{method}{request_path}{body}"
-        signature = self._generate_signature(sign_str)
+        sign_str = f"{ts}{method}{request_path}"
+        signature = self._generate_signature(sign_str, payload)
         return signature
 
     def _get_timestamp(self) -> str:
@@ -563,17 +567,12 @@ class OkxApiClient(ApiClient):
     def _get_headers(
         self, ts: str, method: str, request_path: str, payload: bytes
     ) -> Dict[str, Any]:
-        headers = self._headers
         signature = self._get_signature(ts, method, request_path, payload)
-        headers.update(
-            {
-                "OK-ACCESS-KEY": self._api_key,
-                "OK-ACCESS-SIGN": signature,
-                "OK-ACCESS-TIMESTAMP": ts,
-                "OK-ACCESS-PASSPHRASE": self._passphrase,
-            }
-        )
-        return headers
+        return {
+            **self._signed_headers,
+            "OK-ACCESS-SIGN": signature,
+            "OK-ACCESS-TIMESTAMP": ts,
+        }
 
     async def _fetch(
         self,
@@ -610,7 +609,9 @@ class OkxApiClient(ApiClient):
         payload = payload or {}
 
         payload_json = (
-            urlencode(payload) if method == "GET" else msgspec.json.encode(payload)
+            encode_query(payload)
+            if method == "GET"
+            else self._msg_encoder.encode(payload)
         )
 
         if method == "GET":
@@ -622,9 +623,7 @@ class OkxApiClient(ApiClient):
             headers = self._get_headers(timestamp, method, request_path, payload_json)
 
         try:
-            self._log.debug(
-                f"{method} {request_path} Headers: {headers} payload: {payload_json}"
-            )
+            self._log.debug("{} {} payload: {}", method, request_path, payload_json)
 
             response = await self._session.request(
                 method=method,
@@ -656,17 +655,8 @@ class OkxApiClient(ApiClient):
                     status_code=response.status_code,
                     message=okx_error_response.msg,
                 )
-        except CurlCffiExceptions.Timeout as e:
-            self._log.error(f"Timeout {method} {request_path} {e}")
-            raise
-        except CurlCffiExceptions.ConnectionError as e:
-            self._log.error(f"Connection Error {method} {request_path} {e}")
-            raise
-        except CurlCffiExceptions.HTTPError as e:
-            self._log.error(f"HTTP Error {method} {request_path} {e}")
-            raise
         except CurlCffiExceptions.RequestException as e:
-            self._log.error(f"Request Error {method} {request_path} {e}")
+            self._log.error(f"{type(e).__name__} {method} {request_path} {e}")
             raise
         except Exception as e:
             self._log.error(f"Error {method} {request_path} {e}")
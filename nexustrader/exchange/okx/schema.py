@@ -91,7 +91,7 @@ class OkxWsBboTbtMsg(msgspec.Struct):
     data: list[OkxWsBboTbtData]
 
 
-class OkxWsBook5BookDelta(msgspec.Struct, array_like=True):
+class OkxWsBook5BookDelta(msgspec.Struct, array_like=True, gc=False):
     price: str
     size: str
     feature: str
@@ -161,7 +161,7 @@ class OkxWsMarkPriceMsg(msgspec.Struct):
     data: list[OkxWsMarkPriceData]
 
 
-class OkxWsTradeData(msgspec.Struct):
+class OkxWsTradeData(msgspec.Struct, gc=False):
     instId: str
     tradeId: str
     px: str
@@ -121,10 +121,11 @@ class OkxWSClient(WSClient):
             self._send(payload)
 
     async def _subscribe(self, params: List[Dict[str, Any]], auth: bool = False):
-        params = [param for param in params if param not in self._subscriptions]
+        params = self._add_subscriptions(params)
+        if not params:
+            return
 
         for param in params:
-            self._subscriptions.append(param)
             self._log.debug(f"Subscribing to {param}...")
 
         await self.connect()
@@ -214,12 +215,9 @@ class OkxWSClient(WSClient):
         await self._subscribe([params], auth=True)
 
     async def _unsubscribe(self, params: List[Dict[str, Any]]):
-        params_to_unsubscribe = [
-            param for param in params if param in self._subscriptions
-        ]
+        params_to_unsubscribe = self._remove_subscriptions(params)
 
         for param in params_to_unsubscribe:
-            self._subscriptions.remove(param)
             self._log.debug(f"Unsubscribing from {param}...")
 
         if params_to_unsubscribe:
@@ -292,9 +290,10 @@ class OkxWSClient(WSClient):
             self._auth_event = None
             await self._auth()
         batch_size = 50
-        total = len(self._subscriptions)
+        subscriptions = list(self._subscriptions.values())
+        total = len(subscriptions)
         for i in range(0, total, batch_size):
-            chunk = self._subscriptions[i : i + batch_size]
+            chunk = subscriptions[i : i + batch_size]
             self._send_payload(chunk)
             if i + batch_size < total:
                 self._log.info(
@@ -300,7 +300,7 @@ class UnsubscriptionSubmit(Struct):
     params: Dict[str, Any] = field(default_factory=dict)
 
 
-class Order(Struct):
+class Order(Struct, gc=False):
     exchange: ExchangeType
     symbol: str
     status: OrderStatus
@@ -0,0 +1,22 @@
+from decimal import Decimal
+from urllib.parse import urlencode
+
+import pytest
+
+from nexustrader.base.api_client import encode_query
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"instId": "BTC-USDT-SWAP", "limit": 100, "reduceOnly": True},
+        {"price": Decimal("0.10"), "qty": 1.5, "orderId": None},
+        {"symbol": "BTC/USDT"},
+        {"clientOid": "a b"},
+        {"memo": "a=b&c"},
+        {"symbols": ["BTCUSDT", "ETHUSDT"]},
+    ],
+)
+def test_encode_query_matches_urlencode(params):
+    assert encode_query(params) == urlencode(params)
@@ -0,0 +1,24 @@
+from decimal import Decimal
+
+import pytest
+
+from nexustrader.base.precision import precision_quantizer, to_precision
+
+
+@pytest.mark.parametrize(
+    "value, precision, mode, expected",
+    [
+        (0.123456, 0.001, "round", Decimal("0.123")),
+        (0.1235, 0.001, "round", Decimal("0.124")),
+        (0.1231, 0.001, "ceil", Decimal("0.124")),
+        (0.1239, 0.001, "floor", Decimal("0.123")),
+        (12345, 10, "round", Decimal("12350")),
+        (12344, 10, "floor", Decimal("12340")),
+    ],
+)
+def test_to_precision(value, precision, mode, expected):
+    assert to_precision(value, precision, mode) == expected
+
+
+def test_precision_quantizer_is_cached():
+    assert precision_quantizer(0.01) is precision_quantizer(0.01)
@@ -0,0 +1,112 @@
+import asyncio
+
+import msgspec
+from picows import WSMsgType
+
+from nexustrader.base.ws_client import WSClient
+from nexustrader.core.nautilius_core import LiveClock
+
+
+class DummyTaskManager:
+    def __init__(self):
+        self.tasks: list[asyncio.Task] = []
+
+    def create_task(self, coro):
+        task = asyncio.create_task(coro)
+        self.tasks.append(task)
+        return task
+
+    async def cancel(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+
+class DummyTransport:
+    def __init__(self):
+        self._closed = asyncio.Event()
+
+    def disconnect(self):
+        self._closed.set()
+
+    async def wait_disconnected(self):
+        await self._closed.wait()
+
+
+class RecordingTransport:
+    def __init__(self):
+        self.frames: list[tuple[WSMsgType, bytes]] = []
+
+    def send_reuse_external_bytearray(self, msg_type, buffer, offset):
+        self.frames.append((msg_type, bytes(buffer[offset:])))
+
+
+class DummyWSClient(WSClient):
+    def __init__(self):
+        super().__init__(
+            "wss://example.invalid",
+            handler=lambda raw: None,
+            task_manager=DummyTaskManager(),
+            clock=LiveClock(),
+            reconnect_interval=0,
+        )
+        self.connect_calls = 0
+        self.resubscribe_calls = 0
+
+    async def _connect(self):
+        self.connect_calls += 1
+        await asyncio.sleep(0.01)
+        self._transport, self._listener = DummyTransport(), object()
+
+    async def _resubscribe(self):
+        self.resubscribe_calls += 1
+
+
+async def test_concurrent_connect_opens_a_single_connection():
+    client = DummyWSClient()
+    try:
+        await asyncio.gather(*(client.connect() for _ in range(5)))
+
+        assert client.connect_calls == 1
+        assert len(client._task_manager.tasks) == 1
+    finally:
+        await client._task_manager.cancel()
+
+
+async def test_connect_during_reconnect_shares_the_new_connection():
+    client = DummyWSClient()
+    try:
+        await client.connect()
+        dropped = client._transport
+        dropped.disconnect()
+
+        # wait until the reconnect loop is mid-handshake
+        while client.connect_calls < 2:
+            await asyncio.sleep(0)
+        assert not client.connected
+
+        await client.connect()
+
+        assert client.connected
+        assert client._transport is not dropped
+        assert client.connect_calls == 2
+        assert client.resubscribe_calls == 1
+        assert len(client._task_manager.tasks) == 1
+    finally:
+        await client._task_manager.cancel()
+
+
+def test_send_frames_exactly_the_encoded_payload():
+    client = DummyWSClient()
+    client._transport, client._listener = RecordingTransport(), object()
+    long_payload = {"op": "subscribe", "args": [f"tickers.SYM{i}" for i in range(20)]}
+    short_payload = {"op": "ping"}
+
+    assert client._send(long_payload)
+    assert client._send(short_payload)
+
+    # the short frame must not carry the tail of the longer one before it
+    assert client._transport.frames == [
+        (WSMsgType.TEXT, msgspec.json.encode(long_payload)),
+        (WSMsgType.TEXT, msgspec.json.encode(short_payload)),
+    ]
@@ -0,0 +1,82 @@
+import asyncio
+from types import SimpleNamespace
+
+from nexustrader.constants import ExchangeType
+from nexustrader.engine import Engine
+
+
+class LogStub:
+    def __init__(self):
+        self.errors: list[str] = []
+
+    def debug(self, msg):
+        pass
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        self.errors.append(msg)
+
+
+class CancelAllOmsStub:
+    def __init__(self, fail_symbols: set[str] = frozenset()):
+        self.cancelled: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._fail_symbols = fail_symbols
+
+    async def cancel_all_orders(self, symbol: str) -> bool:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if symbol in self._fail_symbols:
+                raise RuntimeError("cancel failed")
+            self.cancelled.append(symbol)
+            return True
+        finally:
+            self.in_flight -= 1
+
+
+def _make_engine(oms: CancelAllOmsStub, symbols: list[str]) -> Engine:
+    engine = Engine.__new__(Engine)
+    engine._log = LogStub()
+    orders = {f"oid-{i}": SimpleNamespace(symbol=s) for i, s in enumerate(symbols)}
+    engine._cache = SimpleNamespace(
+        _mem_open_orders={ExchangeType.OKX: set(orders)},
+        _mem_orders=orders,
+    )
+    engine._ems = {
+        ExchangeType.OKX: SimpleNamespace(
+            _instrument_id_to_account_type=lambda instrument_id: "okx"
+        )
+    }
+    engine._private_connectors = {"okx": SimpleNamespace(_oms=oms)}
+    return engine
+
+
+async def test_cancel_all_open_orders_runs_symbols_concurrently():
+    symbols = [f"{base}USDT-PERP.OKX" for base in ("BTC", "ETH", "SOL", "XRP")]
+    oms = CancelAllOmsStub()
+    engine = _make_engine(oms, symbols)
+
+    await engine._cancel_all_open_orders()
+
+    assert sorted(oms.cancelled) == sorted(symbols)
+    assert oms.max_in_flight > 1
+
+
+async def test_cancel_all_open_orders_logs_failures_without_aborting():
+    symbols = ["BTCUSDT-PERP.OKX", "ETHUSDT-PERP.OKX"]
+    oms = CancelAllOmsStub(fail_symbols={"BTCUSDT-PERP.OKX"})
+    engine = _make_engine(oms, symbols)
+
+    await engine._cancel_all_open_orders()
+
+    assert oms.cancelled == ["ETHUSDT-PERP.OKX"]
+    assert len(engine._log.errors) == 1
+    assert "BTCUSDT-PERP.OKX" in engine._log.errors[0]
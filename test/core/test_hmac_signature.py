@@ -0,0 +1,31 @@
+import base64
+import hashlib
+import hmac
+
+from nexustrader.core.nautilius_core import hmac_signature, hmac_signature_base64
+
+
+def _expected(key: str, msg: str) -> str:
+    return hmac.new(key.encode(), msg.encode(), hashlib.sha256).hexdigest()
+
+
+def test_hmac_signature_matches_stdlib_across_repeated_calls():
+    messages = ["GET/realtime1700000000000", "", "POST/api/v5/trade/order{}"]
+    for _ in range(2):
+        for msg in messages:
+            assert hmac_signature("secret", msg) == _expected("secret", msg)
+
+
+def test_hmac_signature_keeps_keys_separate():
+    msg = "1700000000000GET/api/v5/account/balance"
+    assert hmac_signature("key-a", msg) == _expected("key-a", msg)
+    assert hmac_signature("key-b", msg) == _expected("key-b", msg)
+    assert hmac_signature("key-a", msg) != hmac_signature("key-b", msg)
+
+
+def test_hmac_signature_base64_matches_stdlib_with_body():
+    msg, body = "2024-01-01T00:00:00.000ZPOST/api/v5/trade/order", b'{"sz":"1"}'
+    expected = base64.b64encode(
+        hmac.new(b"secret", msg.encode() + body, hashlib.sha256).digest()
+    ).decode()
+    assert hmac_signature_base64("secret", msg, body) == expected
@@ -0,0 +1,44 @@
+import pytest
+from loguru import logger as _loguru
+
+from nexustrader.core.nautilius_core import Logger
+
+
+class StrCounter:
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "counted"
+
+
+@pytest.fixture
+def records():
+    # add a sink of our own and remove only that one, leaving the session's
+    # handlers (loguru's default stderr sink among them) in place
+    messages: list[str] = []
+    handler_id = _loguru.add(
+        lambda m: messages.append(m.record["message"]), level="INFO"
+    )
+    yield messages
+    _loguru.remove(handler_id)
+
+
+def test_logger_formats_args_only_when_level_is_enabled(records):
+    log = Logger("Test")
+    obj = StrCounter()
+
+    # no handler listens at TRACE, so the argument is never formatted
+    log.trace("Order update: {}", obj)
+    assert obj.calls == 0
+    assert records == []
+
+    log.info("Order update: {}", obj)
+    assert obj.calls == 1
+    assert records == ["Order update: counted"]
+
+
+def test_logger_leaves_braces_alone_without_args(records):
+    Logger("Test").info("payload: {'a': 1}")
+    assert records == ["payload: {'a': 1}"]
@@ -155,11 +155,15 @@ def test_binance_portfolio_margin_init_position_clears_missing_stale_cache():
     oms._exchange_id = ExchangeType.BINANCE
     oms._account_type = SimpleNamespace(is_portfolio_margin=True)
     oms._cache = DummyPositionCache()
+
+    async def no_positions():
+        return []
+
     oms._api_client = SimpleNamespace(
-        get_papi_v1_um_position_risk=lambda: object(),
-        get_papi_v1_cm_position_risk=lambda: object(),
+        get_papi_v1_um_position_risk=no_positions,
+        get_papi_v1_cm_position_risk=no_positions,
     )
-    oms._run_sync = lambda coro: []
+    oms._run_sync = asyncio.run
     oms._cache._apply_position(
         Position(
             symbol=symbol,
@@ -6,6 +6,7 @@ from types import SimpleNamespace
 from nexustrader.constants import ExchangeType, PositionSide
 from nexustrader.core.nautilius_core import LiveClock
 from nexustrader.exchange.bitget.oms import BitgetOrderManagementSystem
+from nexustrader.exchange.bitget.error import BitgetError
 from nexustrader.exchange.bitget.rest_api import BitgetApiClient
 from nexustrader.schema import Position
 
@@ -143,3 +144,27 @@ async def test_bitget_get_market_tickers_uses_async_fetch_and_limiter():
     assert ("/api/v3/market/tickers", "/api/v3/market/tickers", 1) in limiter.calls
     assert session.requests
     assert session.requests[0]["method"] == "GET"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status_code, body, code, message",
+    [
+        (429, b'{"code":"40200","msg":"busy","data":null}', 40200, "busy"),
+        (502, b"<html>Bad Gateway</html>", 502, "HTTP Error 502"),
+    ],
+)
+async def test_bitget_error_response_raises_bitget_error(
+    status_code, body, code, message
+):
+    clock = LiveClock()
+    client = BitgetApiClient(
+        clock=clock, api_key="k", secret="s", passphrase="p", testnet=True
+    )
+    client._session = DummySession(DummyResponse(status_code, body))
+
+    with pytest.raises(BitgetError) as exc_info:
+        await client._fetch_async("GET", "/api/v2/mix/market/ticker")
+
+    assert exc_info.value.code == code
+    assert exc_info.value.message == message
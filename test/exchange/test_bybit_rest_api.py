@@ -1,3 +1,6 @@
+import hashlib
+import hmac
+import asyncio
 import msgspec
 import pytest
 from decimal import Decimal
@@ -80,7 +83,12 @@ def test_bybit_init_position_clears_stale_cache_when_rest_snapshot_is_empty():
     oms = BybitOrderManagementSystem.__new__(BybitOrderManagementSystem)
     oms._exchange_id = ExchangeType.BYBIT
     oms._cache = DummyPositionCache()
-    oms._get_all_positions_list = lambda category, settle_coin=None: []
+
+    async def get_all_positions_list(category, settle_coin=None):
+        return []
+
+    oms._get_all_positions_list = get_all_positions_list
+    oms._run_sync = asyncio.run
     oms._cache._apply_position(
         Position(
             symbol=symbol,
@@ -193,3 +201,35 @@ async def test_bybit_get_kline_uses_async_fetch_and_limiter():
     assert ("public", "/v5/market/kline", 1) in limiter.calls
     assert session.requests
     assert session.requests[0]["method"] == "GET"
+
+
+@pytest.mark.asyncio
+async def test_bybit_signed_post_signs_the_exact_body_bytes_sent():
+    clock = LiveClock()
+    client = BybitApiClient(clock=clock, api_key="k", secret="s", testnet=True)
+    client._next_time_sync_ms = float("inf")
+    session = DummySession(
+        DummyResponse(
+            200,
+            msgspec.json.encode(
+                {"retCode": 0, "retMsg": "OK", "result": {}, "time": 1000}
+            ),
+        )
+    )
+    client._session = session
+
+    await client._fetch(
+        "POST",
+        client._base_url,
+        "/v5/order/create",
+        {"category": "linear", "symbol": "BTCUSDT"},
+        signed=True,
+    )
+
+    request = session.requests[0]
+    assert isinstance(request["data"], bytes)
+    ts = request["headers"]["X-BAPI-TIMESTAMP"]
+    expected = hmac.new(
+        b"s", f"{ts}k{client._recv_window}".encode() + request["data"], hashlib.sha256
+    ).hexdigest()
+    assert request["headers"]["X-BAPI-SIGN"] == expected
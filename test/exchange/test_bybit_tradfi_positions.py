@@ -4,7 +4,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from nexustrader.constants import ExchangeType, PositionSide
+from nexustrader.constants import ExchangeType, OrderSide, OrderType, PositionSide
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.entity import TaskManager
 from nexustrader.core.nautilius_core import LiveClock, MessageBus
@@ -12,7 +12,7 @@ from nexustrader.core.registry import OrderRegistry
 from nexustrader.exchange.bybit_tradfi.constants import BybitTradeFiAccountType
 from nexustrader.exchange.bybit_tradfi.exchange import BybitTradeFiExchangeManager
 from nexustrader.exchange.bybit_tradfi.oms import BybitTradeFiOrderManagementSystem
-from nexustrader.schema import Position
+from nexustrader.schema import BatchOrderSubmit, InstrumentId, Position
 
 
 @pytest.fixture
@@ -89,3 +89,39 @@ async def test_tradfi_refresh_positions_clears_stale_positions(tradfi_oms):
     await oms._async_refresh_positions()
 
     assert cache.get_position("XAUUSD_s.BYBIT_TRADFI") is None
+
+
+@pytest.mark.asyncio
+async def test_tradfi_create_batch_orders_submits_in_order(tradfi_oms):
+    oms, _ = tradfi_oms
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create_order(oid, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return oid
+
+    oms.create_order = create_order
+    orders = [
+        BatchOrderSubmit(
+            symbol="XAUUSD_s.BYBIT_TRADFI",
+            instrument_id=InstrumentId.from_str("XAUUSD_s.BYBIT_TRADFI"),
+            side=OrderSide.BUY,
+            type=OrderType.LIMIT,
+            amount=Decimal("1"),
+            price=Decimal("2300"),
+            oid=f"oid-{i}",
+        )
+        for i in range(3)
+    ]
+
+    results = await oms.create_batch_orders(orders)
+
+    # MT5 requests share one worker thread; the batch must reach it in the
+    # caller's order, e.g. a close before the reopen that follows it
+    assert results == ["oid-0", "oid-1", "oid-2"]
+    assert max_in_flight == 1
@@ -1,3 +1,6 @@
+import base64
+import hashlib
+import hmac
 import msgspec
 import pytest
 from decimal import Decimal
@@ -136,3 +139,49 @@ async def test_okx_get_market_candles_uses_async_fetch_and_limiter():
     assert ("/api/v5/market/candles", "/api/v5/market/candles", 1) in limiter.calls
     assert session.requests
     assert session.requests[0]["method"] == "GET"
+
+
+@pytest.mark.asyncio
+async def test_okx_signed_post_signs_the_exact_body_bytes_sent():
+    clock = LiveClock()
+    client = OkxApiClient(clock=clock, api_key="k", secret="s", passphrase="p")
+    session = DummySession(
+        DummyResponse(200, msgspec.json.encode({"code": "0", "msg": "", "data": []}))
+    )
+    client._session = session
+
+    await client._fetch_async(
+        "POST", "/api/v5/trade/order", {"instId": "BTC-USDT", "sz": "1"}, signed=True
+    )
+
+    request = session.requests[0]
+    assert isinstance(request["data"], bytes)
+    ts = request["headers"]["OK-ACCESS-TIMESTAMP"]
+    expected = base64.b64encode(
+        hmac.new(
+            b"s",
+            f"{ts}POST/api/v5/trade/order".encode() + request["data"],
+            hashlib.sha256,
+        ).digest()
+    ).decode()
+    assert request["headers"]["OK-ACCESS-SIGN"] == expected
+
+
+@pytest.mark.asyncio
+async def test_okx_signed_request_does_not_leak_auth_headers_into_public_ones():
+    clock = LiveClock()
+    client = OkxApiClient(clock=clock, api_key="k", secret="s", passphrase="p")
+    session = DummySession(
+        DummyResponse(200, msgspec.json.encode({"code": "0", "msg": "", "data": []}))
+    )
+    client._session = session
+
+    await client._fetch_async("GET", "/api/v5/account/balance", signed=True)
+    await client._fetch_async("GET", "/api/v5/market/tickers", signed=False)
+
+    signed, public = (r["headers"] for r in session.requests)
+    assert signed["OK-ACCESS-KEY"] == "k"
+    assert signed["OK-ACCESS-PASSPHRASE"] == "p"
+    assert "OK-ACCESS-SIGN" in signed
+    assert "OK-ACCESS-SIGN" not in public
+    assert "OK-ACCESS-KEY" not in public
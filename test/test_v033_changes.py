@@ -81,7 +81,7 @@ class TestBinanceWSClientBatch:
 
     @pytest.mark.asyncio
     async def test_subscribe_skips_duplicates(self, client):
-        client._subscriptions = [f"sym{i}@trade" for i in range(10)]
+        client._add_subscriptions([f"sym{i}@trade" for i in range(10)])
         params = [f"sym{i}@trade" for i in range(15)]  # 10 overlap + 5 new
         await client._subscribe(params)
 
@@ -90,7 +90,7 @@ class TestBinanceWSClientBatch:
 
     @pytest.mark.asyncio
     async def test_resubscribe_over_50(self, client):
-        client._subscriptions = [f"sym{i}@trade" for i in range(120)]
+        client._add_subscriptions([f"sym{i}@trade" for i in range(120)])
         start = time.monotonic()
         await client._resubscribe()
         elapsed = time.monotonic() - start
@@ -98,6 +98,13 @@ class TestBinanceWSClientBatch:
         assert client._send.call_count == 3
         assert elapsed >= 0.9
 
+    def test_send_payload_gives_each_chunk_its_own_id(self, client):
+        client._send_payload([f"sym{i}@trade" for i in range(120)])
+
+        ids = [c.args[0]["id"] for c in client._send.call_args_list]
+        assert len(ids) == 3
+        assert len(set(ids)) == 3
+
 
 class TestBybitWSClientBatch:
     @pytest.fixture
@@ -162,6 +169,26 @@ class TestOkxWSClientBatch:
         assert client._send.call_count == 3
         assert elapsed >= 0.9
 
+    @pytest.mark.asyncio
+    async def test_subscription_tracking_matches_dict_params_by_items(self, client):
+        await client._subscribe([{"channel": "tickers", "instId": "BTC-USDT"}])
+        await client._subscribe([{"instId": "BTC-USDT", "channel": "tickers"}])
+        assert len(client._subscriptions) == 1
+        assert client._send.call_count == 1
+
+        await client._unsubscribe([{"instId": "BTC-USDT", "channel": "tickers"}])
+        assert len(client._subscriptions) == 0
+        assert client._send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resubscribing_same_params_skips_connect(self, client):
+        params = [{"channel": "tickers", "instId": "BTC-USDT"}]
+        await client._subscribe(params)
+        await client._subscribe(params, auth=True)
+
+        assert client.connect.await_count == 1
+        assert client._send.call_count == 1
+
 
 class TestBitgetWSClientBatch:
     @pytest.fixture
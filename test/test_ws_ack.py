@@ -212,11 +212,11 @@ class TestWsRequestNotSentError:
         )
         # Fake a connected transport
         ws._transport = MagicMock()
-        ws._transport.send = MagicMock()
+        ws._transport.send_reuse_external_bytearray = MagicMock()
         ws._listener = MagicMock()
         # Should not raise
         ws._send_or_raise({"op": "test"})
-        assert ws._transport.send.called
+        assert ws._transport.send_reuse_external_bytearray.called
 
 
 # ===========================================================================